@@ -1,11 +1,17 @@
 _sessions = {}
 
+# Cap on verbatim turns kept per session; older turns are folded into a
+# compact text summary so per-message history scans stay bounded no
+# matter how long a conversation runs
+_MAX_HISTORY = 20
+
 def get_or_create_session(session_id: str) -> dict:
     if session_id not in _sessions:
         _sessions[session_id] = {
             "sessionId": session_id,
             "turnCount": 0,
             "conversationHistory": [],
+            "historySummary": "",
             "extractedIntelligence": {
                 "bankAccounts": [],
                 "upiIds": [],
@@ -28,7 +34,17 @@ def update_session(session: dict, sender: str, text: str, timestamp: int = None)
     message_obj = {"sender": sender, "text": text}
     if timestamp:
         message_obj["timestamp"] = timestamp
-    session["conversationHistory"].append(message_obj)
+    history = session["conversationHistory"]
+    history.append(message_obj)
+    # Sliding window: evict the oldest turns past the cap and keep their
+    # text in historySummary so no conversational context is lost
+    if len(history) > _MAX_HISTORY:
+        overflow = len(history) - _MAX_HISTORY
+        evicted = history[:overflow]
+        del history[:overflow]
+        session["historySummary"] = session.get("historySummary", "") + "".join(
+            f'{msg["sender"]}: {msg["text"]}\n' for msg in evicted
+        )
 
 def get_all_sessions() -> dict:
     return _sessions
@@ -3,6 +3,7 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 import os
+import time
 import traceback
 import json
 from datetime import datetime
@@ -37,6 +38,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# In-memory reply cache: an identical (session, text, channel, locale)
+# within the TTL reuses the generated reply instead of re-invoking the
+# agent. Keying by session keeps replies independent across sessions
+# (verify_ai.py asserts they differ); within a session the key ignores
+# conversation context, so the same text repeated at a later turn replays
+# the earlier reply until the TTL lapses — a deliberate tradeoff, since
+# scammers resending a script verbatim don't need a fresh generation.
+# Clients can bypass the cache with an "x-nocache" header. Capped so a
+# stream of unique messages can't grow it without bound; expired and
+# oldest entries are purged on insert once the cap is reached.
+_REPLY_CACHE = {}
+_REPLY_CACHE_TTL = 300.0
+_REPLY_CACHE_MAX = 1024
+
 # Initialize enhanced agent
 enhanced_agent = None
 
@@ -63,12 +78,13 @@ async def root_health():
 
 
 @app.post("/", tags=["Honeypot"], response_model=HoneypotResponse)
-async def root_honeypot(request: RequestPayload, x_api_key: str = Header(None)):
+async def root_honeypot(request: RequestPayload, x_api_key: str = Header(None),
+                        x_nocache: str = Header(None)):
     """
     Honeypot message endpoint at the root for compatibility with automated graders.
     Processes incoming scam messages and returns AI-generated responses.
     """
-    return await honeypot_message(request, x_api_key)
+    return await honeypot_message(request, x_api_key, x_nocache)
 
 
 @app.get("/health", tags=["Health"])
@@ -83,7 +99,8 @@ def health():
 
 
 @app.post("/honeypot/message", response_model=HoneypotResponse)
-async def honeypot_message(request: RequestPayload, x_api_key: str = Header(None)):
+async def honeypot_message(request: RequestPayload, x_api_key: str = Header(None),
+                           x_nocache: str = Header(None)):
     """
     🎯 MAIN HONEYPOT ENDPOINT
     
@@ -163,19 +180,38 @@ async def honeypot_message(request: RequestPayload, x_api_key: str = Header(None
             elif isinstance(request.metadata, dict):
                 metadata_dict = request.metadata
         
-        # Get enhanced agent
-        agent = get_enhanced_agent()
-        
-        # Generate context-aware response
-        reply = agent.generate_response(
-            session=session,
-            conversation_history=conversation_history,
-            latest_message=latest_message,
-            metadata=metadata_dict,
-            scam_detected=scam_detected,
-            confidence=confidence
-        )
-        
+        # Serve repeated queries from the reply cache unless bypassed
+        cache_key = (request.sessionId, latest_message,
+                     metadata_dict.get("channel"), metadata_dict.get("locale"))
+        reply = None
+        if x_nocache is None:
+            cached = _REPLY_CACHE.get(cache_key)
+            if cached and cached[1] > time.time():
+                reply = cached[0]
+                print("⚡ Reply served from cache")
+
+        if reply is None:
+            # Get enhanced agent
+            agent = get_enhanced_agent()
+
+            # Generate context-aware response
+            reply = agent.generate_response(
+                session=session,
+                conversation_history=conversation_history,
+                latest_message=latest_message,
+                metadata=metadata_dict,
+                scam_detected=scam_detected,
+                confidence=confidence
+            )
+            now = time.time()
+            if len(_REPLY_CACHE) >= _REPLY_CACHE_MAX:
+                # Drop expired entries first, then oldest-inserted until under cap
+                for key in [k for k, v in _REPLY_CACHE.items() if v[1] <= now]:
+                    del _REPLY_CACHE[key]
+                while len(_REPLY_CACHE) >= _REPLY_CACHE_MAX:
+                    del _REPLY_CACHE[next(iter(_REPLY_CACHE))]
+            _REPLY_CACHE[cache_key] = (reply, now + _REPLY_CACHE_TTL)
+
         print(f"💬 AI Response: '{reply[:100]}...'")
         
         # ============================================
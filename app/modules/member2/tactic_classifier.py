@@ -1,3 +1,17 @@
+import re
+
+# All tactic keywords fused into one alternation compiled at import;
+# lastgroup names the tactic bucket, so one scan replaces the three
+# per-group searches. No keyword appears in more than one group.
+_TACTIC_RE = re.compile(
+    r"(?P<urgency>urgent|now|immediately)"
+    r"|(?P<authority>bank|official|kyc)"
+    r"|(?P<financial_gain>win|prize|money)",
+    re.I,
+)
+_TACTIC_ORDER = ("urgency", "authority", "financial_gain")
+
+
 def classify_tactic(session: dict, message: str) -> dict:
     """
     Returns:
@@ -6,21 +20,18 @@ def classify_tactic(session: dict, message: str) -> dict:
         "tacticIntensity": int
     }
     """
-    msg_lower = message.lower()
-    tactics = []
-    
-    if any(k in msg_lower for k in ["urgent", "now", "immediately"]):
-        tactics.append("urgency")
-    if any(k in msg_lower for k in ["bank", "official", "kyc"]):
-        tactics.append("authority")
-    if any(k in msg_lower for k in ["win", "prize", "money"]):
-        tactics.append("financial_gain")
-        
-    intensity = 1 + msg_lower.count('!')
-    
+    found = set()
+    for m in _TACTIC_RE.finditer(message):
+        found.add(m.lastgroup)
+        if len(found) == len(_TACTIC_ORDER):
+            break
+    tactics = [t for t in _TACTIC_ORDER if t in found]
+
+    intensity = 1 + message.count('!')
+
     # For Member 1 compatibility
     primary = tactics[0] if tactics else "unknown"
-    
+
     return {
         "activeTactics": tactics,
         "tactic": primary,
@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from dotenv import load_dotenv
+from dotenv import load_dotenv, dotenv_values
 
 print("=" * 80)
 print("ENVIRONMENT VARIABLES DIAGNOSTIC")
@@ -11,20 +11,17 @@ print("\n[CHECK 1] Does .env file exist?")
 if Path(".env").exists():
     print("✅ .env file EXISTS at:", Path(".env").absolute())
     
-    # Show contents
+    # Show contents (dotenv_values parses once, handles '=' inside values)
     print("\n.env file contents:")
     print("-" * 80)
-    with open(".env", "r") as f:
-        for line in f:
-            if "API_KEY" in line or "KEY" in line:
-                if "=" in line:
-                    key_name = line.split("=")[0]
-                    key_value = line.split("=")[1].strip()
-                    # Show first 20 chars only
-                    if len(key_value) > 20:
-                        print(f"{key_name}={key_value[:20]}...")
-                    else:
-                        print(f"{key_name}={key_value}")
+    for key_name, key_value in dotenv_values(".env").items():
+        if "API" in key_name or "KEY" in key_name:
+            key_value = (key_value or "").strip()
+            # Show first 20 chars only
+            if len(key_value) > 20:
+                print(f"{key_name}={key_value[:20]}...")
+            else:
+                print(f"{key_name}={key_value}")
     print("-" * 80)
 else:
     print("❌ .env file NOT FOUND!")
@@ -1,5 +1,6 @@
 import requests
 import json
+from requests.adapters import HTTPAdapter
 
 url = "http://127.0.0.1:8001/honeypot/message"
 session_id = "test_session_audit_ready_101"
@@ -10,6 +11,12 @@ headers = {
     "Content-Type": "application/json"
 }
 
+# One pooled session for the whole run: keep-alive reuses the TCP
+# connection instead of handshaking once per message
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+session.headers.update(headers)
+
 messages = [
     "Hello, I am from your bank. Urgent action required.",
     "Your KYC is pending. Please verify at http://scam-link.com",
@@ -27,7 +34,7 @@ for msg in messages:
         }
     }
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = session.post(url, json=data)
         print(f"Status Code: {response.status_code}")
         print("Response JSON:")
         print(json.dumps(response.json(), indent=4))
@@ -11,22 +11,20 @@ Tests cover:
 - Different scam types
 """
 
-import pytest
-from fastapi.testclient import TestClient
-from app.main import app
+import asyncio
 
-client = TestClient(app)
+import pytest
 
 
 class TestHealthEndpoint:
     """Tests for the health check endpoint."""
-    
-    def test_health_check_returns_200(self):
+
+    def test_health_check_returns_200(self, client):
         """Test that health check returns 200 OK."""
         response = client.get("/")
         assert response.status_code == 200
-    
-    def test_health_check_returns_ok_status(self):
+
+    def test_health_check_returns_ok_status(self, client):
         """Test that health check returns status 'ok'."""
         response = client.get("/")
         data = response.json()
@@ -36,49 +34,23 @@ class TestHealthEndpoint:
 
 class TestHoneypotMessageAuthentication:
     """Tests for API authentication."""
-    
-    def test_invalid_api_key_returns_401(self):
+
+    def test_invalid_api_key_returns_401(self, client, payload_factory):
         """Test that invalid API key returns 401 Unauthorized."""
-        payload = {
-            "sessionId": "test-001",
-            "message": {
-                "sender": "scammer",
-                "text": "Your bank account will be blocked",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "SMS",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
+        payload = payload_factory("Your bank account will be blocked")
+
         response = client.post(
             "/honeypot/message",
             json=payload,
             headers={"x-api-key": "invalid-key"}
         )
-        
+
         assert response.status_code == 401
-    
-    def test_missing_api_key_returns_401(self):
+
+    def test_missing_api_key_returns_401(self, client, payload_factory):
         """Test that missing API key returns 401 Unauthorized."""
-        payload = {
-            "sessionId": "test-001",
-            "message": {
-                "sender": "scammer",
-                "text": "Your bank account will be blocked",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "SMS",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
+        payload = payload_factory("Your bank account will be blocked")
+
         response = client.post("/honeypot/message", json=payload)
         # Authentication is strict in this version
         assert response.status_code == 401
@@ -86,132 +58,95 @@ class TestHoneypotMessageAuthentication:
 
 class TestHoneypotMessageSuccess:
     """Tests for successful honeypot message handling."""
-    
-    def test_basic_scam_message_returns_200(self):
+
+    def test_basic_scam_message_returns_200(self, client, payload_factory, auth_headers):
         """Test that valid scam message returns 200 OK."""
-        payload = {
-            "sessionId": "test-001",
-            "message": {
-                "sender": "scammer",
-                "text": "Your bank account will be blocked today. Verify immediately.",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "SMS",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
+        payload = payload_factory(
+            "Your bank account will be blocked today. Verify immediately."
         )
-        
+
+        response = client.post("/honeypot/message", json=payload, headers=auth_headers)
+
         assert response.status_code == 200
-    
-    def test_response_has_status_and_reply(self):
+
+    def test_response_has_status_and_reply(self, client, payload_factory, auth_headers):
         """Test that response contains status and reply fields."""
-        payload = {
-            "sessionId": "test-002",
-            "message": {
-                "sender": "scammer",
-                "text": "Share your UPI ID to avoid suspension.",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "WhatsApp",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
+        payload = payload_factory(
+            "Share your UPI ID to avoid suspension.",
+            sid="test-002", channel="WhatsApp"
         )
-        
+
+        response = client.post("/honeypot/message", json=payload, headers=auth_headers)
+
         data = response.json()
         assert "status" in data
         assert "reply" in data
         assert data["status"] == "success"
-    
-    def test_reply_is_not_empty(self):
+
+    def test_reply_is_not_empty(self, client, payload_factory, auth_headers):
         """Test that AI reply is not empty."""
-        payload = {
-            "sessionId": "test-003",
-            "message": {
-                "sender": "scammer",
-                "text": "Your Aadhar card has been blocked. Verify immediately.",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "SMS",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
+        payload = payload_factory(
+            "Your Aadhar card has been blocked. Verify immediately.",
+            sid="test-003"
         )
-        
+
+        response = client.post("/honeypot/message", json=payload, headers=auth_headers)
+
         data = response.json()
         assert len(data["reply"]) > 0
         assert isinstance(data["reply"], str)
-    
-    def test_ai_responses_are_different(self):
+
+    def test_ai_responses_are_different(self, client, payload_factory, auth_headers):
         """Test that AI generates different responses for same message."""
-        payload = {
-            "sessionId": "test-004",
-            "message": {
-                "sender": "scammer",
-                "text": "Click here to verify your account: http://fake-bank.com",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "Email",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        headers = {"x-api-key": "guvi-honeypot-demo-key"}
-        
+        payload = payload_factory(
+            "Click here to verify your account: http://fake-bank.com",
+            sid="test-004", channel="Email"
+        )
+        # Bypass the reply cache so the second call actually regenerates;
+        # the stubbed agent makes the replies deterministically distinct
+        headers = {**auth_headers, "x-nocache": "1"}
+
         # Get 2 responses
         response1 = client.post("/honeypot/message", json=payload, headers=headers)
         response2 = client.post("/honeypot/message", json=payload, headers=headers)
-        
+
         reply1 = response1.json()["reply"]
         reply2 = response2.json()["reply"]
-        
-        # At least one should be different (proves AI is generating, not hardcoded)
-        assert reply1 != reply2 or len(set([reply1, reply2])) == 2 or reply1 == reply2
-        # If somehow same twice, that's OK - at least the system isn't completely broken
+
+        # Distinct replies prove the agent is generating, not hardcoded
+        assert reply1 != reply2
         assert len(reply1) > 0 and len(reply2) > 0
 
 
+class TestConcurrentRequests:
+    """Tests for concurrent in-process request handling."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_messages(self, aclient, payload_factory, auth_headers):
+        """Test that two overlapping posts of the same message both succeed."""
+        payload = payload_factory("Your account is blocked", sid="concurrent-001")
+
+        response1, response2 = await asyncio.gather(
+            aclient.post("/honeypot/message", json=payload, headers=auth_headers),
+            aclient.post("/honeypot/message", json=payload, headers=auth_headers),
+        )
+
+        assert response1.status_code == 200
+        assert response2.status_code == 200
+        assert response1.json()["status"] == "success"
+        assert response2.json()["status"] == "success"
+
+
 class TestMultiTurnConversation:
     """Tests for multi-turn conversation handling."""
-    
-    def test_multiturn_with_conversation_history(self):
+
+    def test_multiturn_with_conversation_history(self, client, payload_factory, auth_headers):
         """Test that conversation history is properly handled."""
-        payload = {
-            "sessionId": "multiturn-001",
-            "message": {
-                "sender": "scammer",
-                "text": "Send your CVV number now or account will be closed.",
-                "timestamp": 1770282843747
-            },
-            "conversationHistory": [
+        payload = payload_factory(
+            "Send your CVV number now or account will be closed.",
+            sid="multiturn-001",
+            timestamp=1770282843747,
+            history=[
                 {
                     "sender": "scammer",
                     "text": "Your bank account will be blocked today.",
@@ -222,20 +157,11 @@ class TestMultiTurnConversation:
                     "text": "Why will my account be blocked?",
                     "timestamp": 1770282843746
                 }
-            ],
-            "metadata": {
-                "channel": "SMS",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
+            ]
         )
-        
+
+        response = client.post("/honeypot/message", json=payload, headers=auth_headers)
+
         assert response.status_code == 200
         assert response.json()["status"] == "success"
         assert len(response.json()["reply"]) > 0
@@ -243,293 +169,72 @@ class TestMultiTurnConversation:
 
 class TestRequestValidation:
     """Tests for request validation."""
-    
-    def test_missing_session_id_returns_422(self):
+
+    def test_missing_session_id_returns_422(self, client, payload_factory, auth_headers):
         """Test that missing sessionId returns 422 Validation Error."""
-        payload = {
-            # Missing sessionId
-            "message": {
-                "sender": "scammer",
-                "text": "Your account is blocked",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "SMS",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
-        )
-        
+        payload = payload_factory("Your account is blocked")
+        del payload["sessionId"]
+
+        response = client.post("/honeypot/message", json=payload, headers=auth_headers)
+
         assert response.status_code == 422
-    
-    def test_missing_message_text_returns_422(self):
+
+    def test_missing_message_text_returns_422(self, client, payload_factory, auth_headers):
         """Test that missing message text returns 422 Validation Error."""
-        payload = {
-            "sessionId": "test-005",
-            "message": {
-                "sender": "scammer",
-                # Missing text
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "SMS",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
-        )
-        
+        payload = payload_factory("placeholder", sid="test-005")
+        del payload["message"]["text"]
+
+        response = client.post("/honeypot/message", json=payload, headers=auth_headers)
+
         assert response.status_code == 422
-    
-    def test_invalid_metadata_channel(self):
+
+    def test_invalid_metadata_channel(self, client, payload_factory, auth_headers):
         """Test that valid channels are handled properly."""
-        payload = {
-            "sessionId": "test-006",
-            "message": {
-                "sender": "scammer",
-                "text": "Your account is blocked",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "SMS",  # Valid
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
+        payload = payload_factory(
+            "Your account is blocked",
+            sid="test-006", channel="SMS"  # Valid
         )
-        
+
+        response = client.post("/honeypot/message", json=payload, headers=auth_headers)
+
         assert response.status_code == 200
 
 
 class TestDifferentScamTypes:
     """Tests for different types of scams."""
-    
-    def test_banking_fraud_detection(self):
-        """Test detection of banking fraud."""
-        payload = {
-            "sessionId": "banking-fraud-001",
-            "message": {
-                "sender": "scammer",
-                "text": "URGENT: Your SBI account has been compromised. Share your account number immediately.",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "SMS",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
-        )
-        
-        assert response.status_code == 200
-        assert response.json()["status"] == "success"
-    
-    def test_upi_fraud_detection(self):
-        """Test detection of UPI fraud."""
-        payload = {
-            "sessionId": "upi-fraud-001",
-            "message": {
-                "sender": "scammer",
-                "text": "Share your UPI ID to avoid account suspension.",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "WhatsApp",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
-        )
-        
-        assert response.status_code == 200
-        assert response.json()["status"] == "success"
-    
-    def test_phishing_detection(self):
-        """Test detection of phishing attacks."""
-        payload = {
-            "sessionId": "phishing-001",
-            "message": {
-                "sender": "scammer",
-                "text": "Verify your identity here: http://fake-bank-site.com/login",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "Email",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
-        )
-        
+
+    @pytest.mark.parametrize("sid,channel,text", [
+        ("banking-fraud-001", "SMS",
+         "URGENT: Your SBI account has been compromised. Share your account number immediately."),
+        ("upi-fraud-001", "WhatsApp",
+         "Share your UPI ID to avoid account suspension."),
+        ("phishing-001", "Email",
+         "Verify your identity here: http://fake-bank-site.com/login"),
+    ], ids=["banking_fraud", "upi_fraud", "phishing"])
+    def test_scam_type_detection(self, client, payload_factory, auth_headers, sid, channel, text):
+        """Test detection across banking fraud, UPI fraud and phishing."""
+        payload = payload_factory(text, sid=sid, channel=channel)
+
+        response = client.post("/honeypot/message", json=payload, headers=auth_headers)
+
         assert response.status_code == 200
         assert response.json()["status"] == "success"
 
 
-class TestDifferentChannels:
-    """Tests for different communication channels."""
-    
-    def test_sms_channel(self):
-        """Test handling of SMS channel."""
-        payload = {
-            "sessionId": "sms-001",
-            "message": {
-                "sender": "scammer",
-                "text": "Your account is blocked",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "SMS",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
-        )
-        
-        assert response.status_code == 200
-    
-    def test_whatsapp_channel(self):
-        """Test handling of WhatsApp channel."""
-        payload = {
-            "sessionId": "whatsapp-001",
-            "message": {
-                "sender": "scammer",
-                "text": "Your account is blocked",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "WhatsApp",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
-        )
-        
-        assert response.status_code == 200
-    
-    def test_email_channel(self):
-        """Test handling of Email channel."""
-        payload = {
-            "sessionId": "email-001",
-            "message": {
-                "sender": "scammer",
-                "text": "Your account is blocked",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "Email",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
-        )
-        
-        assert response.status_code == 200
+class TestChannelsAndLocales:
+    """Tests for different communication channels and locales."""
 
+    @pytest.mark.parametrize("sid,channel,locale,text", [
+        ("sms-001", "SMS", "IN", "Your account is blocked"),
+        ("whatsapp-001", "WhatsApp", "IN", "Your account is blocked"),
+        ("email-001", "Email", "IN", "Your account is blocked"),
+        ("locale-in-001", "SMS", "IN", "Your bank account blocked"),
+        ("locale-us-001", "SMS", "US", "Your bank account blocked"),
+    ], ids=["sms", "whatsapp", "email", "locale_in", "locale_us"])
+    def test_metadata_matrix(self, client, payload_factory, auth_headers, sid, channel, locale, text):
+        """Test that every supported channel/locale combination is handled."""
+        payload = payload_factory(text, sid=sid, channel=channel, locale=locale)
+
+        response = client.post("/honeypot/message", json=payload, headers=auth_headers)
 
-class TestDifferentLocales:
-    """Tests for different locales."""
-    
-    def test_india_locale(self):
-        """Test handling of India locale."""
-        payload = {
-            "sessionId": "locale-in-001",
-            "message": {
-                "sender": "scammer",
-                "text": "Your bank account blocked",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "SMS",
-                "language": "English",
-                "locale": "IN"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
-        )
-        
-        assert response.status_code == 200
-    
-    def test_us_locale(self):
-        """Test handling of US locale."""
-        payload = {
-            "sessionId": "locale-us-001",
-            "message": {
-                "sender": "scammer",
-                "text": "Your bank account blocked",
-                "timestamp": 1770282843745
-            },
-            "conversationHistory": [],
-            "metadata": {
-                "channel": "SMS",
-                "language": "English",
-                "locale": "US"
-            }
-        }
-        
-        response = client.post(
-            "/honeypot/message",
-            json=payload,
-            headers={"x-api-key": "guvi-honeypot-demo-key"}
-        )
-        
         assert response.status_code == 200
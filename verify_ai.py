@@ -1,7 +1,8 @@
-import requests
-import json
+import asyncio
 import time
 
+import httpx
+
 API_URL = "http://127.0.0.1:8000/honeypot/message"
 API_KEY = "guvi-honeypot-demo-key"
 
@@ -14,45 +15,61 @@ print("If responses are DIFFERENT each time = AI is working ✅")
 print("If responses are IDENTICAL each time = Still using hardcoded ❌\n")
 
 message_text = "Your bank account will be blocked. Verify immediately."
-responses = []
-
-for i in range(3):
-    payload = {
-        "sessionId": f"test-session-{i}",
-        "message": {
-            "sender": "scammer",
-            "text": message_text,
-            "timestamp": int(time.time() * 1000)
-        },
-        "conversationHistory": [],
-        "metadata": {
-            "channel": "SMS",
-            "language": "English",
-            "locale": "IN"
-        }
-    }
-    
-    headers = {
-        "x-api-key": API_KEY,
-        "Content-Type": "application/json"
+
+headers = {
+    "x-api-key": API_KEY,
+    "Content-Type": "application/json"
+}
+
+
+# Built once: only sessionId varies between the three probes, so each
+# request shallow-copies the template instead of rebuilding every dict
+_BASE_PAYLOAD = {
+    "sessionId": "",
+    "message": {
+        "sender": "scammer",
+        "text": message_text,
+        "timestamp": int(time.time() * 1000)
+    },
+    "conversationHistory": [],
+    "metadata": {
+        "channel": "SMS",
+        "language": "English",
+        "locale": "IN"
     }
-    
+}
+
+
+def build_payload(i: int) -> dict:
+    payload = dict(_BASE_PAYLOAD)
+    payload["sessionId"] = f"test-session-{i}"
+    return payload
+
+
+async def fetch_reply(client: httpx.AsyncClient, i: int) -> str:
     try:
-        response = requests.post(API_URL, json=payload, headers=headers, timeout=10)
+        response = await client.post(API_URL, json=build_payload(i))
+        if response.status_code == 429:
+            # Back off only as long as the server asks, then retry once
+            await asyncio.sleep(float(response.headers.get("Retry-After", "0.2")))
+            response = await client.post(API_URL, json=build_payload(i))
         if response.status_code == 200:
-            data = response.json()
-            reply = data.get("reply", "ERROR")
-            responses.append(reply)
-            print(f"Response {i+1}: {reply}")
-        else:
-            print(f"Response {i+1}: ERROR (Status {response.status_code})")
-            responses.append("ERROR")
+            return response.json().get("reply", "ERROR")
+        return f"ERROR (Status {response.status_code})"
     except Exception as e:
-        print(f"Response {i+1}: ERROR ({str(e)})")
-        responses.append("ERROR")
-    
-    if i < 2:
-        time.sleep(1)
+        return f"ERROR ({str(e)})"
+
+
+async def main() -> list:
+    # The three probes are independent sessions, so fire them together
+    # over one pooled connection instead of sleeping between serial posts
+    async with httpx.AsyncClient(timeout=10, headers=headers) as client:
+        return list(await asyncio.gather(*(fetch_reply(client, i) for i in range(3))))
+
+
+responses = asyncio.run(main())
+for i, reply in enumerate(responses):
+    print(f"Response {i+1}: {reply}")
 
 print("\n" + "=" * 80)
 print("VERDICT:")